@@ -153,16 +153,19 @@ def lamp_reader(path):
     date_match = re.search(r'\d{4}', path.name)
     t0 = datetime.strptime(f'20220305_{date_match.group()}', '%Y%m%d_%H%M')
 
-    with h5py.File(path, 'r') as f:
+    # The default 1 MiB HDF5 chunk cache evicts the chunks between slab reads, so a chunk
+    # that straddles two chunk_size slabs would be read and decompressed twice.
+    with h5py.File(path, 'r', rdcc_nbytes=64 * 1024**2, rdcc_nslots=10007, rdcc_w0=0.75) as f:
         image_keys = [key for key in f.keys() if 'images' in key]
         assert len(image_keys) == 1, f'{len(image_keys)} image keys found in the file {path}.'
-        image_key = image_keys[0]
-        dt = 60 / f[image_key].shape[0]
+        # A lazy h5py.Dataset handle. Only the sliced slabs below are read from disk.
+        image_dataset = f[image_keys[0]]
+        dt = 60 / image_dataset.shape[0]
 
-        for pos in range(0, f[image_key].shape[0], chunk_size):
+        for pos in range(0, image_dataset.shape[0], chunk_size):
             times = np.array([t0 + timedelta(seconds=dt * i) for i in range(pos, pos + chunk_size)])
             # ::-1 switches column to row major
-            images = np.transpose(f[image_key][pos : pos + chunk_size], axes=(0, 2, 1))
+            images = np.transpose(image_dataset[pos : pos + chunk_size], axes=(0, 2, 1))
             # images = f[image_key][pos:pos+chunk_size]
             yield times, images
 
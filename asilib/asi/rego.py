@@ -13,7 +13,6 @@ import dateutil.parser
 import numpy as np
 import pandas as pd
 import scipy.io
-import matplotlib.colors
 import rego_imager_readfile
 
 import asilib
@@ -21,6 +20,7 @@ import asilib.asi.themis as themis
 import asilib.utils as utils
 import asilib.io.download as download
 import asilib.skymap
+import asilib.plot.utils
 
 
 pgm_base_url = 'https://data.phys.ucalgary.ca/sort_by_project/GO-Canada/REGO/stream0/'
@@ -193,7 +193,7 @@ def rego(
         'resolution': (512, 512),
     }
     plot_settings = {
-        'color_map': matplotlib.colors.LinearSegmentedColormap.from_list('black_to_red', ['k', 'r'])
+        'color_map': asilib.plot.utils._REGO_CMAP.copy()
     }
     return imager(file_info, meta, skymap, plot_settings=plot_settings)
 
@@ -294,14 +294,21 @@ def _download_all_skymaps(location_code, url, save_dir, redownload):
 
 def _load_skymap(skymap_path):
     """
-    A helper function to load a REGO skymap and transform it.
+    A helper function to load a REGO skymap and transform it. The transformed skymap
+    is cached next to the skymap file so later calls skip parsing the IDL .sav file.
     """
+    skymap_dict = themis._read_skymap_cache(skymap_path)
+    if skymap_dict is not None:
+        return skymap_dict
+
     # Load the skymap file and convert it to a dictionary.
     skymap_file = scipy.io.readsav(str(skymap_path), python_dict=True)['skymap']
     skymap_dict = {key: copy.copy(skymap_file[key][0]) for key in skymap_file.dtype.names}
 
     skymap_dict = _tranform_longitude_to_180(skymap_dict)
     skymap_dict = _flip_skymap(skymap_dict)
+    skymap_dict = themis._clean_skymap(skymap_dict)
+    themis._write_skymap_cache(skymap_path, skymap_dict)
     skymap_dict['PATH'] = skymap_path
     return skymap_dict
 
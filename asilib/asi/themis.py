@@ -434,18 +434,97 @@ def _download_all_skymaps(location_code, url, save_dir, redownload):
 
 def _load_skymap(skymap_path):
     """
-    A helper function to load a THEMIS skymap and transform it.
+    A helper function to load a THEMIS skymap and transform it. The transformed skymap
+    is cached next to the skymap file so later calls skip parsing the IDL .sav file.
     """
+    skymap_dict = _read_skymap_cache(skymap_path)
+    if skymap_dict is not None:
+        return skymap_dict
+
     # Load the skymap file and convert it to a dictionary.
     skymap_file = scipy.io.readsav(str(skymap_path), python_dict=True)['skymap']
     skymap_dict = {key: copy.copy(skymap_file[key][0]) for key in skymap_file.dtype.names}
 
     skymap_dict = _tranform_longitude_to_180(skymap_dict)
     skymap_dict = _flip_skymap(skymap_dict)
+    skymap_dict = _clean_skymap(skymap_dict)
+    _write_skymap_cache(skymap_path, skymap_dict)
     skymap_dict['PATH'] = skymap_path
     return skymap_dict
 
 
+# Increment when the skymap transformations change so the old caches are not used.
+_SKYMAP_CACHE_VERSION = 1
+
+
+def _clean_skymap(skymap_dict):
+    """
+    Drop the nested IDL structures (i.e., GENERATION_INFO) that can't be cached without
+    pickle, and cast the skymap grids to contiguous float32 arrays. float32 resolves ~1e-5
+    degrees, and it halves the memory moved when the skymaps are masked and plotted. This
+    is applied to the parsed and the cached skymaps so both have the same keys and dtypes.
+    """
+    skymap_dict = {
+        key: value for key, value in skymap_dict.items() if not np.asarray(value).dtype.hasobject
+    }
+    for key in ['FULL_MAP_LATITUDE', 'FULL_MAP_LONGITUDE', 'FULL_ELEVATION', 'FULL_AZIMUTH']:
+        skymap_dict[key] = np.ascontiguousarray(skymap_dict[key], dtype=np.float32)
+    return skymap_dict
+
+
+def _skymap_cache_path(skymap_path):
+    """
+    The path to the skymap cache file, versioned by _SKYMAP_CACHE_VERSION.
+    """
+    return pathlib.Path(skymap_path).with_suffix(f'.cache_v{_SKYMAP_CACHE_VERSION}.npz')
+
+
+def _read_skymap_cache(skymap_path):
+    """
+    Load the transformed skymap arrays saved by _write_skymap_cache(). Returns None if the
+    cache file does not exist, is older than the skymap file (i.e., it was redownloaded),
+    or can't be loaded.
+    """
+    skymap_path = pathlib.Path(skymap_path)
+    cache_path = _skymap_cache_path(skymap_path)
+    if (not cache_path.exists()) or (
+        cache_path.stat().st_mtime < skymap_path.stat().st_mtime
+    ):
+        return None
+
+    try:
+        with np.load(cache_path, allow_pickle=False) as cache:
+            # [()] converts the 0-d arrays back to scalars, i.e., SITE_MAP_LATITUDE.
+            skymap_dict = {key: cache[key][()] for key in cache.files}
+        skymap_dict = _clean_skymap(skymap_dict)
+    except (OSError, ValueError, KeyError) as err:
+        # Fall back to parsing the skymap file.
+        warnings.warn(f'Unable to load the skymap cache {cache_path}: {err}')
+        return None
+    skymap_dict['PATH'] = skymap_path
+    return skymap_dict
+
+
+def _write_skymap_cache(skymap_path, skymap_dict):
+    """
+    Save the transformed skymap arrays to an uncompressed .npz file next to the skymap
+    file. Arrays containing objects, such as the nested IDL structures, are not saved
+    because they can't be loaded without pickle.
+    """
+    cache_path = _skymap_cache_path(skymap_path)
+    arrays = {key: np.asarray(value) for key, value in skymap_dict.items() if key != 'PATH'}
+    arrays = {key: value for key, value in arrays.items() if not value.dtype.hasobject}
+    # Write to a temporary file first so an interrupted write can't leave a corrupt cache.
+    tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, cache_path)
+    except OSError as err:
+        warnings.warn(f'Unable to cache the skymap to {cache_path}: {err}')
+    return
+
+
 def _flip_skymap(skymap):
     """
     IDL is a column-major language while Python is row-major. This function
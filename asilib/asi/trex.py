@@ -1,3 +1,19 @@
+import re
+import functools
+
+import numpy as np
+
+import asilib
+import asilib.utils as utils
+import asilib.skymap
+
+
+rgb_base_url = 'https://data.phys.ucalgary.ca/sort_by_project/TREx/RGB/stream0/'
+local_base_dir = asilib.config['ASI_DATA_DIR'] / 'trex'
+# The first YYYYMMDD_HHMM timestamp on each line, i.e., in each file name.
+_file_time_pattern = re.compile(r'^.*?(\d{8}_\d{4})', re.MULTILINE)
+
+
 def trex_rgb(
     location_code: str,
     time: utils._time_type = None,
@@ -129,13 +145,7 @@ def trex_rgb(
             missing_ok,
         )
 
-        start_times = len(file_paths) * [None]
-        end_times = len(file_paths) * [None]
-        for i, file_path in enumerate(file_paths):
-            date_match = re.search(r'\d{8}_\d{4}', file_path.name)
-            start_times[i] = datetime.strptime(
-                date_match.group(), '%Y%m%d_%H%M')
-            end_times[i] = start_times[i] + timedelta(minutes=1)
+        start_times, end_times = _file_times(file_paths)
         file_info = {
             'path': file_paths,
             'start_time': start_times,
@@ -161,28 +171,7 @@ def trex_rgb(
     else:
         _time = time_range[0]
     _skymap = trex_rgb_skymap(location_code, _time, redownload=redownload)
-    print(_skymap,  "Skymap")
-    print(np.shape(_skymap), 'skymap shape')
-    if custom_alt==False:
-        alt_index = np.where(_skymap['FULL_MAP_ALTITUDE'] / 1000 == alt)[0]
-        assert (
-            len(alt_index) == 1
-        ), f'{alt} km is not in the valid skymap altitudes: {_skymap["FULL_MAP_ALTITUDE"]/1000} km. If you want a custom altitude with less percision, please use the custom_alt keyword'
-        alt_index = alt_index[0]
-        lat=_skymap['FULL_MAP_LATITUDE'][alt_index, :, :]
-        lon=_skymap['FULL_MAP_LONGITUDE'][alt_index, :, :]
-    elif custom_alt =='geodetic':
-        lat,lon = asilib.skymap.geodetic_skymap(
-            (float(_skymap['SITE_MAP_LATITUDE']), float(_skymap['SITE_MAP_LONGITUDE']), float(_skymap['SITE_MAP_ALTITUDE']) / 1e3),
-            _skymap['FULL_AZIMUTH'],
-            _skymap['FULL_ELEVATION'],
-            alt
-            )
-    elif custom_alt == 'interp'
-        interp_lat = utils.calculate_slope(_skymap['FULL_MAP_LATITUDE'][0, :, :], _skymap['FULL_MAP_LATITUDE'][1, :, :], _skymap['FULL_MAP_ALTITUDE'] / 1000, _skymap['FULL_MAP_ALTITUDE'] / 1000)  #Get the skymap then interp both
-        interp_lon = utils.calculate_slope(_skymap['FULL_MAP_LONGITUDE'][0, :, :], _skymap['FULL_MAP_LONGITUDE'][1, :, :], _skymap['FULL_MAP_ALTITUDE'] / 1000 , _skymap['FULL_MAP_ALTITUDE'] / 1000)  #Get the skymap then interp both
-        lat = utils.interpolate_matrix(_skymap['FULL_MAP_LATITUDE'][0, :, :], interp_lat,  _skymap['FULL_MAP_ALTITUDE'] / 1000, alt)
-        lon = utils.interpolate_matrix(_skymap['FULL_MAP_LONGITUDE'][0, :, :], interp_lon,  _skymap['FULL_MAP_ALTITUDE'] / 1000, alt)
+    lat, lon = _skymap_lat_lon(_skymap, alt, custom_alt, redownload=redownload)
 
     skymap = {
         'lat': lat,
@@ -205,3 +194,99 @@ def trex_rgb(
     }
     plot_settings = {'color_norm':'lin'}
     return imager(file_info, meta, skymap, plot_settings=plot_settings)
+
+
+
+def _file_times(file_paths):
+    """
+    Parse the start and end times of the one minute TREx-RGB files from the YYYYMMDD_HHMM
+    timestamp in their names. All of the names are parsed in one regex call.
+    """
+    file_names = '\n'.join(file_path.name for file_path in file_paths)
+    date_matches = _file_time_pattern.findall(file_names)
+    if len(date_matches) != len(file_paths):
+        # Otherwise the file paths and times would be misaligned.
+        bad_paths = [
+            file_path for file_path in file_paths
+            if _file_time_pattern.match(file_path.name) is None
+        ]
+        raise ValueError(f'Unable to parse the time from the TREx-RGB file: {bad_paths[0]}')
+    start_times = np.array(
+        [f'{d[:4]}-{d[4:6]}-{d[6:8]}T{d[9:11]}:{d[11:13]}' for d in date_matches],
+        dtype='datetime64[m]',
+    )
+    end_times = start_times + np.timedelta64(1, 'm')
+    return start_times.tolist(), end_times.tolist()
+
+
+def _skymap_lat_lon(_skymap, alt, custom_alt, redownload=False):
+    """
+    Calculate the (lat, lon) skymaps at the alt altitude (in km). The custom_alt skymaps
+    are cached by the skymap path, alt, and custom_alt so that the repeated trex_rgb() calls
+    (e.g., one for every time_range) skip the custom_alt calculations.
+    """
+    if custom_alt==False:
+        alt_km = _skymap['FULL_MAP_ALTITUDE'] / 1000
+        alt_index = np.where(alt_km == alt)[0]
+        assert (
+            len(alt_index) == 1
+        ), f'{alt} km is not in the valid skymap altitudes: {alt_km} km. If you want a custom altitude with less percision, please use the custom_alt keyword'
+        alt_index = alt_index[0]
+        lat=_skymap['FULL_MAP_LATITUDE'][alt_index, :, :]
+        lon=_skymap['FULL_MAP_LONGITUDE'][alt_index, :, :]
+        return lat, lon
+
+    if redownload:
+        _custom_alt_lat_lon.cache_clear()
+    lat, lon = _custom_alt_lat_lon(_SkymapKey(_skymap), alt, custom_alt)
+    # Copies because Imagers._calc_overlap_mask() modifies the Imager skymaps in place.
+    return lat.copy(), lon.copy()
+
+
+class _SkymapKey:
+    """
+    Wraps a skymap so that functools.lru_cache hashes and compares it by its path.
+    """
+    def __init__(self, skymap):
+        self.path = str(skymap['PATH'])
+        self.skymap = skymap
+
+    def __hash__(self):
+        return hash(self.path)
+
+    def __eq__(self, other):
+        return self.path == other.path
+
+
+@functools.lru_cache(maxsize=64)
+def _custom_alt_lat_lon(skymap_key, alt, custom_alt):
+    """
+    Calculate the custom_alt (lat, lon) skymaps. See _skymap_lat_lon().
+    """
+    _skymap = skymap_key.skymap
+    # The cache keeps skymap_key, so drop its reference to the full skymap arrays.
+    skymap_key.skymap = None
+
+    if custom_alt =='geodetic':
+        lat,lon = asilib.skymap.geodetic_skymap(
+            (float(_skymap['SITE_MAP_LATITUDE']), float(_skymap['SITE_MAP_LONGITUDE']), float(_skymap['SITE_MAP_ALTITUDE']) / 1e3),
+            _skymap['FULL_AZIMUTH'],
+            _skymap['FULL_ELEVATION'],
+            alt
+            )
+    elif custom_alt == 'interp':
+        # Interpolate between the two official skymap altitudes that bracket alt.
+        alt_km = _skymap['FULL_MAP_ALTITUDE'] / 1000
+        i = np.clip(np.searchsorted(alt_km, alt) - 1, 0, alt_km.shape[0] - 2)
+        lat, lon = utils.interp_lat_lon(
+            alt_km[i],
+            alt_km[i + 1],
+            _skymap['FULL_MAP_LATITUDE'][i, :, :],
+            _skymap['FULL_MAP_LATITUDE'][i + 1, :, :],
+            _skymap['FULL_MAP_LONGITUDE'][i, :, :],
+            _skymap['FULL_MAP_LONGITUDE'][i + 1, :, :],
+            alt,
+        )
+    else:
+        raise ValueError(f'custom_alt must be False, "geodetic", or "interp", got {custom_alt}.')
+    return lat, lon
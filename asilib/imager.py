@@ -40,6 +40,7 @@ except ImportError as err:
 
 import asilib
 import asilib.map
+import asilib.plot.utils
 import asilib.utils as utils
 
 
@@ -77,6 +78,8 @@ class Imager:
         self.skymap = {k.lower(): v for k, v in skymap.items()}
         self.plot_settings = {k.lower(): v for k, v in plot_settings.items()}
         self._accumulate_n = 1
+        self._low_horizon_masks = {}
+        self._mapped_lon_lat_grids = {}
         return
 
     def plot_fisheye(
@@ -544,21 +547,23 @@ class Imager:
         """
         Plot the image onto a geographic map using the modified version of plt.pcolormesh.
         """
-        _masked_lon_map, _masked_lat_map, _masked_image = self._mask_low_horizon(
-            self.skymap['lon'], self.skymap['lat'], self.skymap['el'], min_elevation, image=image
-        )
-
         pcolormesh_kwargs_copy = pcolormesh_kwargs.copy()
         if cartopy_imported and isinstance(ax, cartopy.mpl.geoaxes.GeoAxes):
             assert 'transform' not in pcolormesh_kwargs.keys(), (
                 f"The pcolormesh_kwargs in Imager.plot_map() can't contain "
                 f"'transform' key because it is reserved for cartopy."
             )
-            pcolormesh_kwargs_copy['transform'] = ccrs.PlateCarree()
-        p = self._pcolormesh_nan(
-            _masked_lon_map,
-            _masked_lat_map,
-            _masked_image,
+            # The grids are already in the map projection, so cartopy doesn't reproject them.
+            _mapped_lon_map, _mapped_lat_map = self._mapped_lon_lat(
+                min_elevation, ax.projection, image.shape[:2]
+            )
+            pcolormesh_kwargs_copy['transform'] = ax.projection
+        else:
+            _mapped_lon_map, _mapped_lat_map = self._mapped_lon_lat(min_elevation)
+        p = self._pcolormesh_image(
+            _mapped_lon_map,
+            _mapped_lat_map,
+            image,
             ax,
             cmap=color_map,
             norm=color_norm,
@@ -584,6 +589,16 @@ class Imager:
             label = None
         return ax, p, label
 
+    def _update_mapped_image(self, p, image, color_map, color_norm, color_brighten):
+        """
+        Replace the image plotted by _plot_mapped_image(). The skymap does not change between
+        images, so reusing the pcolormesh object skips recalculating (and reprojecting) the mesh.
+        """
+        p.set_array(self._pcolormesh_array(image, color_brighten))
+        p.set_cmap(color_map)
+        p.set_norm(color_norm)
+        return
+
     def animate_map(self, **kwargs) -> None:
         """
         A wrapper for the ```animate_map_gen()``` method that animates a series of
@@ -812,14 +827,21 @@ class Imager:
             iter_length=self._estimate_n_times(),
             text=self.animation_name,
         )
+        pcolormesh_obj = None
+        label_obj = None
         for i, (image_time, image) in _progressbar:
             # Use an underscore so the original method parameters are not overwritten.
             _color_map, _color_norm = self._plot_params(image, color_bounds, color_map, color_norm)
 
-            ax, pcolormesh_obj, label_obj = self._plot_mapped_image(
-                ax, image, min_elevation, _color_map, _color_norm, color_brighten, asi_label, 
-                pcolormesh_kwargs
-            )
+            if pcolormesh_obj is None:
+                ax, pcolormesh_obj, label_obj = self._plot_mapped_image(
+                    ax, image, min_elevation, _color_map, _color_norm, color_brighten, asi_label, 
+                    pcolormesh_kwargs
+                )
+            else:
+                self._update_mapped_image(
+                    pcolormesh_obj, image, _color_map, _color_norm, color_brighten
+                )
 
             # Give the user the control of the subplot, image object, and return the image time
             # so that they can manipulate the image to add, for example, the satellite track.
@@ -830,10 +852,11 @@ class Imager:
             plt.savefig(image_save_dir / save_name)
             image_paths.append(image_save_dir / save_name)
 
-            # Clean up the objects that this method generated.
-            if label_obj is not None:
-                # ax.texts.remove(label_obj)
-                label_obj.remove()
+        # Clean up the objects that this method generated.
+        if label_obj is not None:
+            # ax.texts.remove(label_obj)
+            label_obj.remove()
+        if pcolormesh_obj is not None:
             # ax.collections.remove(pcolormesh_obj)
             pcolormesh_obj.remove()
 
@@ -1464,8 +1487,7 @@ class Imager:
                 else:
                     color_bounds = self.plot_settings['color_bounds']
             else:
-                lower, upper = np.quantile(image, (0.25, 0.98))
-                color_bounds = [lower, np.min([upper, lower * 10])]
+                color_bounds = asilib.plot.utils.get_color_bounds(image)
         else:
             if callable(color_bounds):  # function that ouputs vmin, vmax
                 color_bounds = color_bounds(image)
@@ -1673,12 +1695,7 @@ class Imager:
         Mask the image, skymap['lon'], skymap['lat'] arrays with np.nans
         where the skymap['el'] < min_elevation or is nan.
         """
-        idh = np.where(np.isnan(el_map) | (el_map < min_elevation))
-        # Copy variables to not modify original np.arrays.
-        lon_map_copy = lon_map.copy()
-        lat_map_copy = lat_map.copy()
-        lon_map_copy[idh] = np.nan
-        lat_map_copy[idh] = np.nan
+        bad_lat_lon = self._low_horizon_mask(el_map, lon_map.shape, min_elevation)
 
         # if image is not None:
         #     image_copy = image.copy()
@@ -1688,21 +1705,70 @@ class Imager:
         # else:
         #     image_copy = None
 
-        if (lon_map.shape[0] == el_map.shape[0] + 1) and (lon_map.shape[1] == el_map.shape[1] + 1):
+        # np.where() returns new arrays, so the original skymap arrays are not modified.
+        lon_map_copy = np.where(bad_lat_lon, np.nan, lon_map)
+        lat_map_copy = np.where(bad_lat_lon, np.nan, lat_map)
+        return lon_map_copy, lat_map_copy, image
+
+    def _mapped_lon_lat(self, min_elevation, projection=None, image_shape=None):
+        """
+        The skymap['lon'] and skymap['lat'] grids masked below min_elevation and compressed
+        by _compress_nan_grid(), ready for _pcolormesh_image(). The grids only depend on the
+        skymap, so they are calculated once for each min_elevation and reused for every image.
+        If projection is a cartopy CRS, the grids are also projected from PlateCarree to it.
+        Grids of pixel centers (same shape as image_shape) are first converted to pixel edges,
+        like cartopy does with the PlateCarree transform, so the plots are unchanged.
+        """
+        lon_map, lat_map, el_map = self.skymap['lon'], self.skymap['lat'], self.skymap['el']
+        # CRS objects compare by their definition, so every map with the same projection
+        # shares the projected grids.
+        key = (id(lon_map), id(lat_map), id(el_map), min_elevation, projection, image_shape)
+        # The cache holds references to the skymap arrays, so their id()s can't be reused.
+        if key in self._mapped_lon_lat_grids:
+            return self._mapped_lon_lat_grids[key][1]
+
+        if projection is None:
+            _masked_lon_map, _masked_lat_map, _ = self._mask_low_horizon(
+                lon_map, lat_map, el_map, min_elevation
+            )
+            self._compress_nan_grid(_masked_lon_map, _masked_lat_map)
+        else:
+            _lon_map, _lat_map = self._mapped_lon_lat(min_elevation)
+            _lon_map, _lat_map = _pixel_edges(_lon_map, _lat_map, image_shape)
+            _projected = projection.transform_points(ccrs.PlateCarree(), _lon_map, _lat_map)
+            _masked_lon_map = np.ascontiguousarray(_projected[..., 0])
+            _masked_lat_map = np.ascontiguousarray(_projected[..., 1])
+        self._mapped_lon_lat_grids[key] = (
+            (lon_map, lat_map, el_map),
+            (_masked_lon_map, _masked_lat_map),
+        )
+        return _masked_lon_map, _masked_lat_map
+
+    def _low_horizon_mask(self, el_map, lat_lon_shape, min_elevation):
+        """
+        The boolean mask that is True for the lat/lon_map pixels where skymap['el'] < min_elevation
+        or is nan. The skymap does not change between images, so the mask is calculated once
+        for each el_map and min_elevation, and is reused when animating.
+        """
+        key = (id(el_map), lat_lon_shape, min_elevation)
+        # The cache holds a reference to el_map, so its id() can't be reused by another array.
+        if (key in self._low_horizon_masks) and (self._low_horizon_masks[key][0] is el_map):
+            return self._low_horizon_masks[key][1]
+
+        bad = np.isnan(el_map) | (el_map < min_elevation)
+        if (lat_lon_shape[0] == el_map.shape[0] + 1) and (lat_lon_shape[1] == el_map.shape[1] + 1):
             # TODO: This is REGO/THEMIS specific. Remove here and add this to the themis() function?
             # For some reason the THEMIS & REGO lat/lon_map arrays are one size larger than el_map, so
-            # here we mask the boundary indices in el_map by adding 1 to both the rows
-            # and columns.
-            idh_boundary_bottom = (
-                idh[0] + 1,
-                idh[1],
-            )  # idh is a tuple so we have to create a new one.
-            idh_boundary_right = (idh[0], idh[1] + 1)
-            lon_map_copy[idh_boundary_bottom] = np.nan
-            lat_map_copy[idh_boundary_bottom] = np.nan
-            lon_map_copy[idh_boundary_right] = np.nan
-            lat_map_copy[idh_boundary_right] = np.nan
-        return lon_map_copy, lat_map_copy, image
+            # here we also mask the boundary indices below and to the right of each masked
+            # el_map pixel.
+            bad_lat_lon = np.zeros(lat_lon_shape, dtype=bool)
+            bad_lat_lon[:-1, :-1] |= bad
+            bad_lat_lon[1:, :-1] |= bad
+            bad_lat_lon[:-1, 1:] |= bad
+        else:
+            bad_lat_lon = bad
+        self._low_horizon_masks[key] = (el_map, bad_lat_lon)
+        return bad_lat_lon
 
     def _create_animation(
         self,
@@ -1813,31 +1879,43 @@ class Imager:
 
         Function taken from `Michael, scivision @ GitHub <https://github.com/scivision/python-matlab-examples/blob/0dd8129bda8f0ec2c46dae734d8e43628346388c/PlotPcolor/pcolormesh_NaN.py>`_.
         """
+        self._compress_nan_grid(x, y)
+        return self._pcolormesh_image(
+            x,
+            y,
+            image,
+            ax,
+            cmap=cmap,
+            norm=norm,
+            color_brighten=color_brighten,
+            pcolormesh_kwargs=pcolormesh_kwargs,
+        )
+
+    def _compress_nan_grid(self, x: np.ndarray, y: np.ndarray) -> None:
+        """
+        Compress the nan values in the periphery of the x and y grids, in place, to the
+        nearest valid grid values. See _pcolormesh_nan() for the algorithm.
+        """
         # mask is True when lat and lon grid values are not nan.
         mask = np.isfinite(x) & np.isfinite(y)
-        top = None
-        bottom = None
-
-        for i, m in enumerate(mask):
-            # A common use for nonzero is to find the indices of
-            # an array, where a condition is True (not nan or inf)
-            good = m.nonzero()[0]
-
-            if good.size == 0:  # Skip row is all columns are nans.
-                continue
-            # First row that has at least 1 valid value.
-            elif top is None:
-                top = i
-            # Bottom row that has at least 1 value value. All indices in between top and bottom
-            else:
-                bottom = i
-
-            # Reassign all lat/lon columns after good[-1] (all nans) to good[-1].
-            x[i, good[-1] :] = x[i, good[-1]]
-            y[i, good[-1] :] = y[i, good[-1]]
-            # Reassign all lat/lon columns before good[0] (all nans) to good[0].
-            x[i, : good[0]] = x[i, good[0]]
-            y[i, : good[0]] = y[i, good[0]]
+        valid_rows = mask.any(axis=1)
+        # First and last rows that have at least 1 valid value.
+        top = valid_rows.argmax()
+        bottom = valid_rows.shape[0] - 1 - valid_rows[::-1].argmax()
+
+        # The first and last valid column in each row. argmax() returns the first True index.
+        first = mask.argmax(axis=1)[:, np.newaxis]
+        last = mask.shape[1] - 1 - mask[:, ::-1].argmax(axis=1)[:, np.newaxis]
+        columns = np.arange(mask.shape[1])[np.newaxis, :]
+        # Skip rows where all columns are nans.
+        before_first = (columns < first) & valid_rows[:, np.newaxis]
+        after_last = (columns > last) & valid_rows[:, np.newaxis]
+
+        for grid in (x, y):
+            # Reassign all lat/lon columns after last (all nans) to last.
+            np.copyto(grid, np.take_along_axis(grid, last, axis=1), where=after_last)
+            # Reassign all lat/lon columns before first (all nans) to first.
+            np.copyto(grid, np.take_along_axis(grid, first, axis=1), where=before_first)
 
         # Reassign all of the fully invalid lat/lon rows above top to the the max lat/lon value.
         x[:top, :] = np.nanmax(x[top, :])
@@ -1845,16 +1923,27 @@ class Imager:
         # Same, but for the rows below bottom.
         x[bottom:, :] = np.nanmax(x[bottom, :])
         y[bottom:, :] = np.nanmax(y[bottom, :])
-        
-        if len(self.meta['resolution']) == 3: #tests to see if the colors selected for an rgb image are rgb or rb or something else
-            image = self._rgb_replacer(image)
-            if color_brighten:
-                image = image / np.max(image)
-            
+        return
+
+    def _pcolormesh_image(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        image: np.ndarray,
+        ax,
+        cmap=None,
+        norm=None,
+        color_brighten: bool = True,
+        pcolormesh_kwargs={},
+    ):
+        """
+        Plot the image with plt.pcolormesh on the x and y grids that are already compressed by
+        _compress_nan_grid().
+        """
         p = ax.pcolormesh(
             x,
             y,
-            image,
+            self._pcolormesh_array(image, color_brighten),
             cmap=cmap,
             shading='auto',
             norm=norm,
@@ -1862,6 +1951,42 @@ class Imager:
         )
         return p
 
+    def _pcolormesh_array(self, image: np.ndarray, color_brighten: bool = True) -> np.ndarray:
+        """
+        Prepare the image for plt.pcolormesh or QuadMesh.set_array.
+        """
+        if len(self.meta['resolution']) == 3: #tests to see if the colors selected for an rgb image are rgb or rb or something else
+            image = self._rgb_replacer(image)
+            if color_brighten:
+                image = image / np.max(image)
+        return image
+
+
+def _pixel_edges(lon_map: np.ndarray, lat_map: np.ndarray, image_shape: tuple):
+    """
+    Convert the lon_map and lat_map pixel centers to pixel edges along the axes where they
+    have the same length as the image. The edges are the midpoints between the neighboring
+    centers (accounting for the longitude wrap), extrapolated at the boundary. This is the
+    same algorithm cartopy's pcolormesh uses with shading='auto' and a PlateCarree transform.
+    """
+
+    def _interp_grid(grid, wrap=0):
+        d_grid = np.diff(grid, axis=1)
+        if wrap:
+            d_grid = (d_grid + wrap / 2) % wrap - wrap / 2
+        d_grid = d_grid / 2
+        return np.hstack(
+            (grid[:, [0]] - d_grid[:, [0]], grid[:, :-1] + d_grid, grid[:, [-1]] + d_grid[:, [-1]])
+        )
+
+    if lon_map.shape[1] == image_shape[1]:
+        lon_map = _interp_grid(lon_map, wrap=360)
+        lat_map = _interp_grid(lat_map)
+    if lon_map.shape[0] == image_shape[0]:
+        lon_map = _interp_grid(lon_map.T, wrap=360).T
+        lat_map = _interp_grid(lat_map.T).T
+    return lon_map, lat_map
+
 
 def _haversine(
     lat1: np.array, lon1: np.array, lat2: np.array, lon2: np.array, r: float = 1
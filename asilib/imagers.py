@@ -337,20 +337,34 @@ class Imagers:
             text=self.animation_name,
         )
 
+        # The pcolormesh objects are created once and their images are replaced in the
+        # following frames.
+        asi_labels = len(self.imagers)*[None]
+        pcolormesh_objs = len(self.imagers)*[None]
         for i, (_guide_time, _asi_times, _asi_images) in _progressbar:
-            asi_labels = len(self.imagers)*[None]
-            pcolormesh_objs = len(self.imagers)*[None]
             for j, (_asi_time, _asi_image) in enumerate(zip(_asi_times, _asi_images)):
                 if _asi_time == datetime.min:
+                    # Hide the unsynchronized imager's previous image.
+                    for obj in (pcolormesh_objs[j], asi_labels[j]):
+                        if obj is not None:
+                            obj.set_visible(False)
                     continue
                 _color_map, _color_norm = self.imagers[j]._plot_params(
                     _asi_image, color_bounds, color_map, color_norm
                     )
 
-                ax, pcolormesh_objs[j], asi_labels[j] = self.imagers[j]._plot_mapped_image(
-                    ax, _asi_image, min_elevation, _color_map, _color_norm, color_brighten, asi_label, 
-                    pcolormesh_kwargs
-                )
+                if pcolormesh_objs[j] is None:
+                    ax, pcolormesh_objs[j], asi_labels[j] = self.imagers[j]._plot_mapped_image(
+                        ax, _asi_image, min_elevation, _color_map, _color_norm, color_brighten, 
+                        asi_label, pcolormesh_kwargs
+                    )
+                else:
+                    self.imagers[j]._update_mapped_image(
+                        pcolormesh_objs[j], _asi_image, _color_map, _color_norm, color_brighten
+                    )
+                    for obj in (pcolormesh_objs[j], asi_labels[j]):
+                        if obj is not None:
+                            obj.set_visible(True)
 
             # Give the user the control of the subplot, image object, and return the image time
             # so that they can manipulate the image to add, for example, the satellite track.
@@ -361,13 +375,13 @@ class Imagers:
             plt.savefig(image_save_dir / save_name)
             image_paths.append(image_save_dir / save_name)
 
-            # Clean up the objects that this method generated.
-            for _asi_label in asi_labels:
-                if _asi_label is not None:
-                    _asi_label.remove()
-            for pcolormesh_obj in pcolormesh_objs:
-                if pcolormesh_obj is not None:
-                    pcolormesh_obj.remove()
+        # Clean up the objects that this method generated.
+        for _asi_label in asi_labels:
+            if _asi_label is not None:
+                _asi_label.remove()
+        for pcolormesh_obj in pcolormesh_objs:
+            if pcolormesh_obj is not None:
+                pcolormesh_obj.remove()
         
         self.imagers[0]._create_animation(image_paths, movie_save_path, ffmpeg_params, overwrite)
         return
@@ -606,6 +620,8 @@ class Imagers:
             far_pixels = np.where(min_distances != i)
             imager.skymap['lat'][far_pixels] = np.nan
             imager.skymap['lon'][far_pixels] = np.nan
+            # The lat/lon skymaps changed in place, so clear the cached plotting grids.
+            imager._mapped_lon_lat_grids.clear()
         self._masked = True  # A flag to not run again.
         return
     
@@ -6,6 +6,7 @@ from typing import Tuple
 from copy import copy
 import warnings
 import re
+import functools
 
 import numpy as np
 import cdflib
@@ -220,6 +221,7 @@ def load_skymap(
 
     if redownload:
         skymap_paths = download_skymap(asi_array_code.lower(), location_code, redownload=redownload)
+        _read_skymap.cache_clear()  # The redownloaded files may differ from the cached ones.
 
     else:
         # If the user does not want to force download skymap files,
@@ -256,7 +258,17 @@ def load_skymap(
         closest_index = np.nanargmin(dt)
     skymap_path = skymap_paths[closest_index]
 
-    # Load the skymap file and convert it to a dictionary.
+    # Copy the cached skymap so the caller can modify it without corrupting the cache.
+    return {key: copy(value) for key, value in _read_skymap(skymap_path).items()}
+
+
+@functools.lru_cache(maxsize=32)
+def _read_skymap(skymap_path):
+    """
+    Load the skymap file and convert it to a dictionary. The result is cached by
+    path since skymaps change at most every few months, so repeated calls for the
+    same imager (or nearby times) skip the slow IDL .sav parsing.
+    """
     skymap_file = scipy.io.readsav(str(skymap_path), python_dict=True)['skymap']
     skymap_dict = {key: copy(skymap_file[key][0]) for key in skymap_file.dtype.names}
 
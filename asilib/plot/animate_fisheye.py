@@ -15,6 +15,7 @@ import asilib
 from asilib.io import utils
 from asilib.io.load import load_image, load_skymap
 from asilib.analysis.start_generator import start_generator
+from asilib.plot.utils import get_color_map, get_color_bounds
 
 
 def animate_fisheye(
@@ -218,12 +219,7 @@ def animate_fisheye_generator(
     image_save_dir.mkdir(parents=True)
     print(f'Created a {image_save_dir} directory')
 
-    if (color_map == 'auto') and (asi_array_code.lower() == 'themis'):
-        color_map = 'Greys_r'
-    elif (color_map == 'auto') and (asi_array_code.lower() == 'rego'):
-        color_map = colors.LinearSegmentedColormap.from_list('black_to_red', ['k', 'r'])
-    else:
-        raise NotImplementedError('color_map == "auto" but the asi_array_code is unsupported')
+    color_map = get_color_map(asi_array_code, color_map)
 
     # With the @start_generator decorator, when this generator first gets called, it
     # will halt here. This way the errors due to missing data will be raised up front.
@@ -244,8 +240,7 @@ def animate_fisheye_generator(
         # color_bounds will be overwritten after the first iteration which will
         # disable the dynamic color bounds for each image.
         if color_bounds is None:
-            lower, upper = np.quantile(image, (0.25, 0.98))
-            _color_bounds = [lower, np.min([upper, lower * 10])]
+            _color_bounds = get_color_bounds(image)
         else:
             _color_bounds = color_bounds
 
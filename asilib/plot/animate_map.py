@@ -15,6 +15,7 @@ from asilib.io.load import load_image
 from asilib.io.load import load_skymap
 from asilib.plot.plot_map import make_map
 from asilib.plot.plot_map import _pcolormesh_nan
+from asilib.plot.plot_map import _mask_low_horizon
 from asilib.analysis.start_generator import start_generator
 from asilib.plot.animate_fisheye import _write_movie
 from asilib.plot.animate_fisheye import Images
@@ -342,32 +343,3 @@ def animate_map_generator(
     movie_save_path = image_save_dir.parents[1] / movie_save_name
     _write_movie(image_paths, movie_save_path, ffmpeg_output_params, overwrite)
     return
-
-
-def _mask_low_horizon(images, lon_map, lat_map, el_map, min_elevation):
-    """
-    Mask the images, skymap['FULL_MAP_LONGITUDE'], skymap['FULL_MAP_LONGITUDE'] arrays
-    with np.nans where the skymap['FULL_ELEVATION'] is nan or
-    skymap['FULL_ELEVATION'] < min_elevation.
-    """
-    idh = np.where(np.isnan(el_map) | (el_map < min_elevation))
-    # Copy variables to not modify original np.arrays.
-    images_copy = images.copy()
-    lon_map_copy = lon_map.copy()
-    lat_map_copy = lat_map.copy()
-    # Can't mask image unless it is a float array.
-    image_copy = images_copy.astype(float)
-    image_copy[:, idh] = np.nan
-    lon_map_copy[idh] = np.nan
-    lat_map_copy[idh] = np.nan
-
-    # For some reason the lat/lon_map arrays are one size larger than el_map, so
-    # here we mask the boundary indices in el_map by adding 1 to both the rows
-    # and columns.
-    idh_boundary_bottom = (idh[0] + 1, idh[1])  # idh is a tuple so we have to create a new one.
-    idh_boundary_right = (idh[0], idh[1] + 1)
-    lon_map_copy[idh_boundary_bottom] = np.nan
-    lat_map_copy[idh_boundary_bottom] = np.nan
-    lon_map_copy[idh_boundary_right] = np.nan
-    lat_map_copy[idh_boundary_right] = np.nan
-    return images_copy, lon_map_copy, lat_map_copy
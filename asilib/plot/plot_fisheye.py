@@ -9,6 +9,7 @@ import numpy as np
 
 from asilib.io import load
 from asilib.io import utils
+from asilib.plot.utils import get_color_map, get_color_bounds
 
 
 def plot_fisheye(
@@ -124,15 +125,9 @@ def plot_fisheye(
 
     # Figure out the color_bounds from the image data.
     if color_bounds is None:
-        lower, upper = np.quantile(image, (0.25, 0.98))
-        color_bounds = [lower, np.min([upper, lower * 10])]
+        color_bounds = get_color_bounds(image)
 
-    if (color_map == 'auto') and (asi_array_code.lower() == 'themis'):
-        color_map = 'Greys_r'
-    elif (color_map == 'auto') and (asi_array_code.lower() == 'rego'):
-        color_map = colors.LinearSegmentedColormap.from_list('black_to_red', ['k', 'r'])
-    else:
-        raise NotImplementedError('color_map == "auto" but the ASI array is unsupported')
+    color_map = get_color_map(asi_array_code, color_map)
 
     if color_norm == 'log':
         norm = colors.LogNorm(vmin=color_bounds[0], vmax=color_bounds[1])
@@ -150,11 +150,9 @@ def plot_map(
         skymap['FULL_MAP_LATITUDE'][alt_index, :, :],
         skymap['FULL_ELEVATION'],
         min_elevation,
+        norm=norm,
     )
 
-    if norm:
-        image /= np.nanmax(image)
-
     # Set up the plot parameters
     if ax is None:
         ax = make_map(
@@ -317,29 +315,24 @@ def _pcolormesh_nan(
     """
     # mask is True when lat and lon grid values are not nan.
     mask = np.isfinite(x) & np.isfinite(y)
-    top = None
-    bottom = None
-
-    for i, m in enumerate(mask):
-        # A common use for nonzero is to find the indices of
-        # an array, where a condition is True (not nan or inf)
-        good = m.nonzero()[0]
-
-        if good.size == 0:  # Skip row is all columns are nans.
-            continue
-        # First row that has at least 1 valid value.
-        elif top is None:
-            top = i
-        # Bottom row that has at least 1 value value. All indices in between top and bottom
-        else:
-            bottom = i
-
-        # Reassign all lat/lon columns after good[-1] (all nans) to good[-1].
-        x[i, good[-1] :] = x[i, good[-1]]
-        y[i, good[-1] :] = y[i, good[-1]]
-        # Reassign all lat/lon columns before good[0] (all nans) to good[0].
-        x[i, : good[0]] = x[i, good[0]]
-        y[i, : good[0]] = y[i, good[0]]
+    valid_rows = mask.any(axis=1)
+    # First and last rows that have at least 1 valid value.
+    top = valid_rows.argmax()
+    bottom = valid_rows.shape[0] - 1 - valid_rows[::-1].argmax()
+
+    # The first and last valid column in each row. argmax() returns the first True index.
+    first = mask.argmax(axis=1)[:, np.newaxis]
+    last = mask.shape[1] - 1 - mask[:, ::-1].argmax(axis=1)[:, np.newaxis]
+    columns = np.arange(mask.shape[1])[np.newaxis, :]
+    # Skip rows where all columns are nans.
+    before_first = (columns < first) & valid_rows[:, np.newaxis]
+    after_last = (columns > last) & valid_rows[:, np.newaxis]
+
+    for grid in (x, y):
+        # Reassign all lat/lon columns after last (all nans) to last.
+        np.copyto(grid, np.take_along_axis(grid, last, axis=1), where=after_last)
+        # Reassign all lat/lon columns before first (all nans) to first.
+        np.copyto(grid, np.take_along_axis(grid, first, axis=1), where=before_first)
 
     # Reassign all of the fully invalid lat/lon rows above top to the the max lat/lon value.
     x[:top, :] = np.nanmax(x[top, :])
@@ -361,30 +354,38 @@ def _pcolormesh_nan(
     return p
 
 
-def _mask_low_horizon(image, lon_map, lat_map, el_map, min_elevation):
+def _mask_low_horizon(image, lon_map, lat_map, el_map, min_elevation, norm=False):
     """
     Mask the image, skymap['FULL_MAP_LONGITUDE'], skymap['FULL_MAP_LONGITUDE'] arrays
     with np.nans where the skymap['FULL_ELEVATION'] is nan or
-    skymap['FULL_ELEVATION'] < min_elevation.
+    skymap['FULL_ELEVATION'] < min_elevation. If norm is True, the masked image is also
+    normalized by its maximum unmasked value.
     """
-    idh = np.where(np.isnan(el_map) | (el_map < min_elevation))
-    # Copy variables to not modify original np.arrays.
-    image_copy = image.copy()
-    lon_map_copy = lon_map.copy()
-    lat_map_copy = lat_map.copy()
-    # Can't mask image unless it is a float array.
-    image_copy = image_copy.astype(float)
-    image_copy[idh] = np.nan
-    lon_map_copy[idh] = np.nan
-    lat_map_copy[idh] = np.nan
+    bad = np.isnan(el_map) | (el_map < min_elevation)
+    # Can't mask image unless it is a float array. astype() and np.divide() return a copy
+    # so the original np.array is not modified.
+    if norm and (~bad).any():
+        # The maximum is found on the unmasked pixels of the original image, and the division
+        # creates the float copy, so the masked float image is not traversed again.
+        if np.issubdtype(image.dtype, np.integer):
+            initial = np.iinfo(image.dtype).min
+        else:
+            initial = -np.inf
+        image_max = np.nanmax(image, initial=initial, where=~bad)
+        image_copy = np.divide(image, image_max, dtype=float)
+    else:
+        # Also when every pixel is masked, so there is no maximum to normalize by.
+        image_copy = image.astype(float)
+    np.copyto(image_copy, np.nan, where=bad)
 
     # For some reason the lat/lon_map arrays are one size larger than el_map, so
-    # here we mask the boundary indices in el_map by adding 1 to both the rows
-    # and columns.
-    idh_boundary_bottom = (idh[0] + 1, idh[1])  # idh is a tuple so we have to create a new one.
-    idh_boundary_right = (idh[0], idh[1] + 1)
-    lon_map_copy[idh_boundary_bottom] = np.nan
-    lat_map_copy[idh_boundary_bottom] = np.nan
-    lon_map_copy[idh_boundary_right] = np.nan
-    lat_map_copy[idh_boundary_right] = np.nan
+    # here we also mask the boundary indices below and to the right of each masked
+    # el_map pixel.
+    bad_lat_lon = np.zeros(lon_map.shape, dtype=bool)
+    bad_lat_lon[:-1, :-1] |= bad
+    bad_lat_lon[1:, :-1] |= bad
+    bad_lat_lon[:-1, 1:] |= bad
+    # np.where() returns new arrays, so lon_map and lat_map are not modified.
+    lon_map_copy = np.where(bad_lat_lon, np.nan, lon_map)
+    lat_map_copy = np.where(bad_lat_lon, np.nan, lat_map)
     return image_copy, lon_map_copy, lat_map_copy
@@ -3,27 +3,78 @@ import matplotlib.colors as colors
 
 # TODO: Make all of the other plot functions call these ones.
 
+# The default color maps, created once instead of every time an image is plotted. Callers get
+# copies of the Colormap objects, so changing one (e.g., set_bad()) doesn't change the default.
+_THEMIS_CMAP = 'Greys_r'
+_REGO_CMAP = colors.LinearSegmentedColormap.from_list('black_to_red', ['k', 'r'], N=256)
+_COLOR_MAPS = {'themis': _THEMIS_CMAP, 'rego': _REGO_CMAP}
+
 
 def get_color_bounds(image):
     """
     A decent default for the minimum and maximum colorbar values for aurora images. This way
     bright objects like the moon don't saturate the image while preserving enough dynamic range.
     """
-    lower, upper = np.nanquantile(image, (0.25, 0.98))
+    lower, upper = _approximate_quantiles(image, (0.25, 0.98))
     color_bounds = [lower, np.min([upper, lower * 10])]
     return color_bounds
 
 
-def get_color_map(asi_array_code, color_map):
+def _approximate_quantiles(image, quantiles, bins=4096):
     """
-    Color maps for the THEMIS and REGO ASIs.
+    The nan-ignoring quantiles of the image calculated from its histogram. Unlike
+    np.nanquantile, this does not need to partition a copy of the image.
+
+    Integer images (i.e., raw ASI counts) are binned by value, so their quantiles are exact and
+    match np.nanquantile. Float images are approximated by linearly interpolating within the
+    histogram bin, so the error is much smaller than (max(image) - min(image))/bins, which is
+    plenty for color bounds. Images with at most bins finite values fall back to np.nanquantile.
     """
-    if (color_map == 'auto') and (asi_array_code.lower() == 'themis'):
-        color_map = 'Greys_r'
-    elif (color_map == 'auto') and (asi_array_code.lower() == 'rego'):
-        color_map = colors.LinearSegmentedColormap.from_list('black_to_red', ['k', 'r'])
+    if np.issubdtype(image.dtype, np.integer):
+        finite_image = image.ravel()
     else:
+        finite_image = image[np.isfinite(image)]
+    if finite_image.size == 0:
+        return np.full(len(quantiles), np.nan)
+    if finite_image.size <= bins:
+        return np.nanquantile(finite_image, quantiles)
+    low, high = finite_image.min(), finite_image.max()
+    if low == high:
+        return np.full(len(quantiles), low, dtype=float)
+
+    if np.issubdtype(image.dtype, np.integer) and int(high) - int(low) < 2**16:
+        # One bin per integer value, so the sorted image is known exactly from the cdf.
+        cdf = np.cumsum(np.bincount(finite_image.astype(np.intp) - int(low)))
+        positions = np.asarray(quantiles) * (cdf[-1] - 1)
+        k = np.floor(positions).astype(np.intp)
+        lower = np.searchsorted(cdf, k, side='right')
+        upper = np.searchsorted(cdf, np.minimum(k + 1, cdf[-1] - 1), side='right')
+        return int(low) + lower + (positions - k) * (upper - lower)
+
+    bin_width = (float(high) - float(low)) / bins
+    bin_idx = ((finite_image - low) / bin_width).astype(np.intp)
+    np.minimum(bin_idx, bins - 1, out=bin_idx)  # The maximum value belongs in the last bin.
+    counts = np.bincount(bin_idx, minlength=bins)
+    cdf = np.cumsum(counts)
+
+    targets = np.asarray(quantiles) * cdf[-1]
+    i = np.searchsorted(cdf, targets)
+    previous_cdf = np.where(i > 0, cdf[i - 1], 0)
+    return low + (i + (targets - previous_cdf) / counts[i]) * bin_width
+
+
+def get_color_map(asi_array_code, color_map):
+    """
+    Color maps for the THEMIS and REGO ASIs. If color_map is not 'auto', it is returned
+    unchanged. The default Colormap objects are copied so the caller can modify them.
+    """
+    if color_map != 'auto':
+        return color_map
+    if asi_array_code.lower() not in _COLOR_MAPS:
         raise NotImplementedError('color_map == "auto" but the asi_array_code is unsupported')
+    color_map = _COLOR_MAPS[asi_array_code.lower()]
+    if isinstance(color_map, colors.Colormap):
+        color_map = color_map.copy()
     return color_map
 
 
@@ -7,6 +7,7 @@ import matplotlib.testing.decorators
 import asilib
 import asilib.asi
 from asilib.asi.fake_asi import fake_asi
+from asilib.imager import _pixel_edges
 
 
 ##########################################
@@ -89,6 +90,78 @@ def test_plot_keogram():
     return
 
 
+def test_pixel_edges():
+    """
+    Tests that the skymap pixel centers are converted to edges across the antimeridian, and that
+    the edge (vertex) grids are unchanged.
+    """
+    lon_map = np.array([[179, -179, -177], [179, -179, -177]], dtype=float)
+    lat_map = np.array([[10, 10, 10], [12, 12, 12]], dtype=float)
+    lon_edges, lat_edges = _pixel_edges(lon_map, lat_map, (2, 3))
+    np.testing.assert_equal(lon_edges, np.tile([178, 180, -178, -176], (3, 1)))
+    np.testing.assert_equal(lat_edges, np.tile([[9], [11], [13]], (1, 4)))
+
+    # Only the axis that has the same length as the image is converted to edges.
+    lon_edges, lat_edges = _pixel_edges(lon_map, lat_map, (2, 2))
+    assert lon_edges.shape == lat_edges.shape == (3, 3)
+    np.testing.assert_equal(lon_edges, lon_map[[0, 0, 0], :])
+
+    # Vertex grids are one pixel larger than the image, so they are returned unchanged.
+    lon_edges, lat_edges = _pixel_edges(lon_map, lat_map, (1, 2))
+    assert lon_edges is lon_map
+    assert lat_edges is lat_map
+    return
+
+
+@pytest.mark.parametrize("extra", [0, 1])
+def test_plot_map_projected_grids(extra):
+    """
+    Tests that plotting with the grids that are projected once (to the GeoAxes projection) is
+    the same as letting cartopy transform the PlateCarree grids for every image.
+    """
+    ccrs = pytest.importorskip('cartopy.crs')
+    import matplotlib.pyplot as plt
+
+    n = 64
+    yy, xx = np.mgrid[: n + extra, : n + extra]
+    skymap = {
+        'lon': -100 + (xx - 32) * 0.15 + (yy - 32) * 0.02,
+        'lat': 60 + (yy - 32) * 0.1,
+        'el': 90 - np.hypot(*np.mgrid[:n, :n] - 32) * 3.0,
+    }
+    if extra:
+        # Like the THEMIS and REGO skymaps, the vertex beyond the el_map corner is nan.
+        skymap['lon'][-1, -1] = np.nan
+    meta = {'resolution': (n, n), 'lon': -100, 'lat': 60, 'location': 'TEST'}
+    image = np.random.default_rng(0).random((n, n)) * 1000 + 10
+    imager = asilib.Imager({}, meta, skymap)
+    color_map, color_norm = imager._plot_params(image, (10, 1010), None, 'lin')
+
+    canvases = []
+    for projected in [True, False]:
+        fig = plt.figure(figsize=(4, 4), dpi=100)
+        ax = fig.add_subplot(projection=ccrs.Orthographic(-100, 55))
+        ax.set_extent((-110, -90, 54, 66), crs=ccrs.PlateCarree())
+        if projected:
+            imager._plot_mapped_image(ax, image, 10, color_map, color_norm, True, False, {})
+        else:
+            lon_map, lat_map = imager._mapped_lon_lat(10)
+            imager._pcolormesh_image(
+                lon_map,
+                lat_map,
+                image,
+                ax,
+                cmap=color_map,
+                norm=color_norm,
+                pcolormesh_kwargs={'transform': ccrs.PlateCarree()},
+            )
+        fig.canvas.draw()
+        canvases.append(np.asarray(fig.canvas.buffer_rgba()).copy())
+        plt.close(fig)
+    np.testing.assert_array_equal(*canvases)
+    return
+
+
 ##########################################
 ############# TEST EXAMPLES ##############
 ##########################################
@@ -0,0 +1,57 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from asilib.plot.plot_map import _mask_low_horizon
+
+
+def _mask_then_norm(image, lon_map, lat_map, el_map, min_elevation):
+    """
+    The original algorithm: mask a float copy of the image, then normalize it by its nanmax.
+    """
+    image, lon_map, lat_map = _mask_low_horizon(image, lon_map, lat_map, el_map, min_elevation)
+    image /= np.nanmax(image)
+    return image, lon_map, lat_map
+
+
+def _skymap(n=32):
+    yy, xx = np.mgrid[: n + 1, : n + 1]
+    lon_map = -100 + (xx - n / 2) * 0.15
+    lat_map = 60 + (yy - n / 2) * 0.1
+    el_map = 90 - np.hypot(*np.mgrid[:n, :n] - n / 2) * 5.0
+    el_map[0, 0] = np.nan
+    return lon_map, lat_map, el_map
+
+
+@pytest.mark.parametrize("dtype", [np.uint16, np.int32, np.float32, np.float64])
+def test_mask_low_horizon_norm(dtype):
+    lon_map, lat_map, el_map = _skymap()
+    image = np.random.default_rng(0).integers(0, 3000, el_map.shape).astype(dtype)
+    # The brightest pixel is below the horizon, so it must not be the normalization.
+    image[0, 1] = 10_000
+
+    normed = _mask_low_horizon(image, lon_map, lat_map, el_map, 10, norm=True)
+    expected = _mask_then_norm(image, lon_map, lat_map, el_map, 10)
+    for normed_array, expected_array in zip(normed, expected):
+        np.testing.assert_allclose(normed_array, expected_array)
+    assert normed[0].dtype == float
+    assert np.nanmax(normed[0]) == 1
+    return
+
+
+@pytest.mark.parametrize("dtype", [np.uint16, np.float64])
+def test_mask_low_horizon_norm_all_masked(dtype):
+    # Every pixel is below min_elevation, so the image is all nans like before.
+    lon_map, lat_map, el_map = _skymap()
+    image = np.ones(el_map.shape, dtype=dtype)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        normed_image, _, _ = _mask_low_horizon(image, lon_map, lat_map, el_map, 95, norm=True)
+    assert normed_image.dtype == float
+    assert np.isnan(normed_image).all()
+    with pytest.warns(RuntimeWarning):
+        expected_image, _, _ = _mask_then_norm(image, lon_map, lat_map, el_map, 95)
+    np.testing.assert_array_equal(normed_image, expected_image)
+    return
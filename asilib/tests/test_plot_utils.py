@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from asilib.plot.utils import get_color_bounds, get_color_map, _approximate_quantiles, _REGO_CMAP
+
+quantiles = (0.25, 0.98)
+
+
+def test_approximate_quantiles_all_nan():
+    image = np.full((100, 100), np.nan)
+    np.testing.assert_equal(_approximate_quantiles(image, quantiles), [np.nan, np.nan])
+    return
+
+
+def test_approximate_quantiles_constant():
+    image = np.full((100, 100), 7, dtype=np.uint16)
+    np.testing.assert_equal(_approximate_quantiles(image, quantiles), [7, 7])
+    return
+
+
+def test_approximate_quantiles_small():
+    # Small images use np.nanquantile so they are not coarsened by the histogram bins.
+    image = np.array([5, 5, 5, 100])
+    np.testing.assert_allclose(_approximate_quantiles(image, quantiles), [5, 94.3])
+    return
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.int8, np.uint16, np.int16, np.int64])
+def test_approximate_quantiles_integer(dtype):
+    # Integer images are binned by value, so the quantiles are exact.
+    info = np.iinfo(dtype)
+    rng = np.random.default_rng(0)
+    image = rng.integers(max(info.min, -3000), min(info.max, 3000), (256, 256)).astype(dtype)
+    np.testing.assert_allclose(
+        _approximate_quantiles(image, quantiles), np.nanquantile(image, quantiles)
+    )
+    return
+
+
+def test_approximate_quantiles_float():
+    rng = np.random.default_rng(0)
+    image = rng.lognormal(mean=8, size=(256, 256))
+    image[:10, :] = np.nan
+    approximate = _approximate_quantiles(image, quantiles)
+    tolerance = (np.nanmax(image) - np.nanmin(image)) / 4096
+    np.testing.assert_allclose(approximate, np.nanquantile(image, quantiles), atol=tolerance)
+    return
+
+
+def test_get_color_bounds():
+    rng = np.random.default_rng(0)
+    image = rng.integers(3000, 10_000, (256, 256)).astype(np.uint16)
+    lower, upper = np.quantile(image, quantiles)
+    np.testing.assert_allclose(get_color_bounds(image), [lower, np.min([upper, lower * 10])])
+    return
+
+
+def test_get_color_map_copy():
+    # Modifying the returned color map must not change the default for the next plots.
+    color_map = get_color_map('REGO', 'auto')
+    assert color_map is not _REGO_CMAP
+    color_map.set_bad('w')
+    assert _REGO_CMAP.get_bad().tolist() != color_map.get_bad().tolist()
+    assert get_color_map('THEMIS', 'auto') == 'Greys_r'
+    assert get_color_map('REGO', 'viridis') == 'viridis'
+    return
@@ -2,12 +2,20 @@
 Tests the themis() data loading and the example plotting functions.
 """
 from datetime import datetime
+import os
 
+import numpy as np
 import requests
 import pytest
 import matplotlib.testing.decorators
 
 import asilib.asi
+from asilib.asi.themis import (
+    _clean_skymap,
+    _write_skymap_cache,
+    _read_skymap_cache,
+    _skymap_cache_path,
+)
 
 ##########################################
 ############# TEST LOADERS ###############
@@ -35,6 +43,52 @@ def test_themis_time():
     return
 
 
+def test_themis_skymap_cache(tmp_path):
+    """
+    Tests that the skymap cache round trips the skymap arrays and scalars, drops the nested
+    IDL structures, and that it is ignored when the skymap file is newer than the cache or
+    the cache is corrupt.
+    """
+    skymap_path = tmp_path / 'themis_skymap_gill_20130103-%2B_vXX.sav'
+    skymap_path.touch()
+    skymap = {
+        'SITE_UID': b'gill',
+        'SITE_MAP_LATITUDE': np.float32(56.3494),
+        'FULL_MAP_LATITUDE': np.random.rand(3, 257, 257),
+        'FULL_MAP_LONGITUDE': np.random.rand(3, 257, 257),
+        'FULL_ELEVATION': np.random.rand(256, 256),
+        'FULL_AZIMUTH': np.random.rand(256, 256),
+        # scipy.io.readsav() returns nested IDL structures as record arrays with object fields.
+        'GENERATION_INFO': np.rec.fromarrays(
+            [np.array([b'author'], dtype=object), np.array([b'2013-01-03'], dtype=object)],
+            names=['AUTHOR', 'DATE'],
+        ),
+    }
+    skymap = _clean_skymap(skymap)
+    assert 'GENERATION_INFO' not in skymap
+    assert skymap['FULL_MAP_LATITUDE'].dtype == np.float32
+
+    _write_skymap_cache(skymap_path, skymap)
+    cached_skymap = _read_skymap_cache(skymap_path)
+    assert cached_skymap.keys() == {*skymap.keys(), 'PATH'}
+    assert cached_skymap['PATH'] == skymap_path
+    assert cached_skymap['SITE_UID'] == b'gill'
+    assert float(cached_skymap['SITE_MAP_LATITUDE']) == float(skymap['SITE_MAP_LATITUDE'])
+    np.testing.assert_equal(cached_skymap['FULL_MAP_LATITUDE'], skymap['FULL_MAP_LATITUDE'])
+    assert cached_skymap['FULL_MAP_LATITUDE'].dtype == np.float32
+
+    cache_path = _skymap_cache_path(skymap_path)
+    cache_mtime = cache_path.stat().st_mtime
+    os.utime(skymap_path, (cache_mtime + 10, cache_mtime + 10))
+    assert _read_skymap_cache(skymap_path) is None
+
+    cache_path.write_bytes(b'not a npz file')
+    os.utime(skymap_path, (cache_mtime - 10, cache_mtime - 10))
+    with pytest.warns(UserWarning):
+        assert _read_skymap_cache(skymap_path) is None
+    return
+
+
 def test_themis_time_range():
     """
     Tests that multiple files are loaded using themis()'s time_range kwarg.
@@ -2,12 +2,15 @@
 Tests the rego() data loading and the example plotting functions.
 """
 from datetime import datetime
+import pathlib
 
+import numpy as np
 import requests
 import pytest
 import matplotlib.testing.decorators
 
 import asilib.asi
+from asilib.asi.trex import _skymap_lat_lon, _file_times
 
 ##########################################
 ############# TEST LOADERS ###############
@@ -52,6 +55,62 @@ def test_trex_nir_no_file():
     return
 
 
+def test_trex_file_times():
+    """
+    Tests that the TREx-RGB file times are parsed from the file names, and that a file name
+    without a timestamp raises an error instead of misaligning the files and times.
+    """
+    file_paths = [
+        pathlib.Path('trex', '20211104_0659_luck_rgb-04_full.h5'),
+        pathlib.Path('trex', '20211104_0700_luck_rgb-04_full.h5'),
+        pathlib.Path('trex', '20211231_2359_luck_rgb-04_full.h5'),
+    ]
+    start_times, end_times = _file_times(file_paths)
+    assert start_times == [
+        datetime(2021, 11, 4, 6, 59),
+        datetime(2021, 11, 4, 7, 0),
+        datetime(2021, 12, 31, 23, 59),
+    ]
+    assert end_times == [
+        datetime(2021, 11, 4, 7, 0),
+        datetime(2021, 11, 4, 7, 1),
+        datetime(2022, 1, 1, 0, 0),
+    ]
+    assert _file_times([]) == ([], [])
+
+    file_paths.insert(1, pathlib.Path('trex', 'luck_rgb-04_full.h5'))
+    with pytest.raises(ValueError, match='luck_rgb-04_full.h5'):
+        _file_times(file_paths)
+    return
+
+
+def test_trex_skymap_lat_lon():
+    """
+    Tests that the official and interpolated (lat, lon) skymaps are correct, and that
+    modifying them in place (e.g., in Imagers._calc_overlap_mask()) does not modify the
+    cached skymaps.
+    """
+    skymap = {
+        'PATH': 'rgb_skymap_test_20230101-%2B_v01.sav',
+        'FULL_MAP_ALTITUDE': np.array([90_000, 110_000, 150_000]),
+        'FULL_MAP_LATITUDE': np.stack([np.full((4, 5), v) for v in (50.0, 52.0, 56.0)]),
+        'FULL_MAP_LONGITUDE': np.stack([np.full((4, 5), v) for v in (-100.0, -101.0, -103.0)]),
+    }
+    lat, lon = _skymap_lat_lon(skymap, 110, False)
+    np.testing.assert_equal(lat, 52)
+    np.testing.assert_equal(lon, -101)
+    with pytest.raises(AssertionError):
+        _skymap_lat_lon(skymap, 130, False)
+
+    for _ in range(2):
+        lat, lon = _skymap_lat_lon(skymap, 130, 'interp')
+        np.testing.assert_allclose(lat, 54)
+        np.testing.assert_allclose(lon, -102)
+        lat[:] = np.nan
+        lon[:] = np.nan
+    return
+
+
 ##########################################
 ############# TEST EXAMPLES ##############
 ##########################################
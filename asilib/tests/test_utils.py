@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
 import dateutil.parser
 
+import numpy as np
 import pytest
 
 import asilib.utils as utils
@@ -115,3 +116,18 @@ def test_get_filename_times_end_minute():
     ]
     dt = 'minutes'
     assert utils.get_filename_times(time_range, dt=dt) == file_times
+
+
+def test_interp_lat_lon():
+    lat0 = np.array([[50, 60], [70, 80]], dtype=float)
+    lon0 = np.array([[-100, -110], [-120, -130]], dtype=float)
+    lat, lon = utils.interp_lat_lon(90, 110, lat0, lat0 + 2, lon0, lon0 - 4, 100)
+    np.testing.assert_allclose(lat, lat0 + 1)
+    np.testing.assert_allclose(lon, lon0 - 2)
+    # The input skymaps must not be modified.
+    np.testing.assert_equal(lat0, [[50, 60], [70, 80]])
+
+    # Extrapolate above the highest altitude.
+    lat, lon = utils.interp_lat_lon(90, 110, lat0, lat0 + 2, lon0, lon0 - 4, 150)
+    np.testing.assert_allclose(lat, lat0 + 6)
+    np.testing.assert_allclose(lon, lon0 - 12)
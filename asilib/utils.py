@@ -3,7 +3,7 @@ A set of utility functions for asilib.
 """
 import dateutil.parser
 import shutil
-from typing import List, Union
+from typing import List, Tuple, Union
 from collections.abc import Iterable
 import copy
 from datetime import timedelta, datetime
@@ -108,6 +108,54 @@ def get_filename_times(time_range: _time_range_type, dt='hours') -> List[datetim
     return times
 
 
+def interp_lat_lon(
+    alt0: float,
+    alt1: float,
+    lat0: np.ndarray,
+    lat1: np.ndarray,
+    lon0: np.ndarray,
+    lon1: np.ndarray,
+    alt: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Linearly interpolate (or extrapolate) the latitude and longitude skymaps from two
+    skymap altitudes to alt. The interpolation weight is calculated once for both skymaps.
+
+    Parameters
+    ----------
+    alt0: float
+        The altitude of the lat0 and lon0 skymaps.
+    alt1: float
+        The altitude of the lat1 and lon1 skymaps.
+    lat0: np.ndarray
+        The latitude skymap at alt0.
+    lat1: np.ndarray
+        The latitude skymap at alt1.
+    lon0: np.ndarray
+        The longitude skymap at alt0.
+    lon1: np.ndarray
+        The longitude skymap at alt1.
+    alt: float
+        The altitude to interpolate to, in the same units as alt0 and alt1.
+
+    Returns
+    -------
+    np.ndarray
+        The latitude skymap at alt.
+    np.ndarray
+        The longitude skymap at alt.
+    """
+    weight = (alt - alt0) / (alt1 - alt0)
+    # Compute map0 + weight*(map1 - map0) in the output arrays to avoid temporary arrays.
+    lat = np.subtract(lat1, lat0)
+    np.multiply(lat, weight, out=lat)
+    np.add(lat, lat0, out=lat)
+    lon = np.subtract(lon1, lon0)
+    np.multiply(lon, weight, out=lon)
+    np.add(lon, lon0, out=lon)
+    return lat, lon
+
+
 def progressbar(iterator: Iterable, iter_length: int = None, text: str = None):
     """
     A terminal progress bar.